@@ -6,7 +6,7 @@ from os.path import join, dirname
 import yaml
 
 from . import Game, dynamic, liquidate, simulation
-from .tools import Clock
+from .tools import Clock, Store
 
 
 def load(data):
@@ -43,11 +43,23 @@ def parse():
     parser.add_argument(
         '-c', '--clock',
         action='store_true',
-        help="include clock report in output")
+        help="include clock report in output (recompute solver results)")
     parser.add_argument(
         '-n', '--size',
         type=int, default=10000,
         help='sample size per strategy')
+    parser.add_argument(
+        '-r', '--seed',
+        type=int,
+        help='random seed for simulations (required to keep samples)')
+    parser.add_argument(
+        '--cache',
+        default=join(dirname(__file__), ".cache"),
+        help='result store directory')
+    parser.add_argument(
+        '-f', '--fresh',
+        action='store_true',
+        help="recompute results even if already stored")
     parser.add_argument(
         'names',
         nargs='*', default=[],
@@ -59,12 +71,15 @@ def main(**kwargs):
     """Get sample size, report expected score and execution time."""
     args = argparse.Namespace(**kwargs) if kwargs else parse()
     game = Game(**load(args.game))
+    store = Store(args.cache, args.fresh)
+    # stored solver results would leave nothing to time
+    timed = Store(args.cache, args.fresh or args.clock)
     if args.liquidate:
-        game = liquidate(game, args.output)
+        game = liquidate(game, args.output, timed)
     if args.dynamic:
-        dynamic(game, args.output)
+        dynamic(game, args.output, timed)
     if args.simulate:
-        simulation(game, args.size, args.names, args.output)
+        simulation(game, args.size, args.names, args.output, args.seed, store)
     if args.clock:
         Clock.report(args.output)
 
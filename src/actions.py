@@ -3,17 +3,28 @@ from dataclasses import replace
 from .dynamic import Solver
 from .simulate import Simulator
 from .strategy import Strategy
-from .tools import Bar, report, table
+from .tools import Bar, digest, report, table
 
 
-def dynamic(game, output=None):
+def dynamic(game, output=None, store=None):
     """Show expected value with dynamic programming."""
-    print("optimal value: ", round(Solver(game).value(), 4), file=output)
+    def compute():
+        return Solver(game).value()
+    if store:
+        value = store.memo(compute, "dynamic", game, Solver)
+    else:
+        value = compute()
+    print("optimal value: ", round(value, 4), file=output)
 
 
-def liquidate(game, output=None):
+def liquidate(game, output=None, store=None):
     """Compute liquidation values equivalent to game and add them in."""
-    prices = Solver(game).value(bonus=True)
+    def compute():
+        return tuple(Solver(game).value(bonus=True))
+    if store:
+        prices = store.memo(compute, "liquidate", game, Solver)
+    else:
+        prices = compute()
     value = prices[0]
     bonus = [p - value for p in prices]
     data = {
@@ -24,13 +35,21 @@ def liquidate(game, output=None):
     return replace(game, liquid=prices)
 
 
-def simulation(game, size, names, output=None):
-    """Run game simulation with given sample size and strategy names."""
-    simulator = Simulator(game)
+def simulation(game, size, names, output=None, seed=None, store=None):
+    """Run game simulation with given sample size and strategy names.
+    Seeded samples are kept in store per strategy, and extended if too small.
+    """
+    simulator = Simulator(game, seed)
     strategies = Strategy.retrieve(*names)
+    store = store if seed is not None else None
     scores = {}
     for name, strategy in strategies.items():
-        with Bar(size, name):
-            scores[name] = simulator.run(size, strategy)
+        key = digest("simulation", game, seed, name, Simulator, strategy)
+        samples = store.get(key, []) if store else []
+        known = len(samples)
+        with Bar(max(size - known, 1), name):
+            scores[name] = simulator.run(size, strategy, samples)
+        if store and len(samples) > len(store.load(key, [])):
+            store.put(key, samples)
     message = "{key:<10}: {value[0]:.2f} - {value[1]:.2f}"
     report("Scores", scores, message, output)
@@ -3,7 +3,8 @@
 from dataclasses import dataclass
 from itertools import repeat
 from multiprocessing import Pool
-from random import randint
+import random
+from typing import Optional
 
 import numpy as np
 import scipy.stats as st
@@ -13,16 +14,21 @@ from .tools import track, chrono
 
 
 CORES = 3
+BLOCK = 1000
 
 
 @dataclass
 class Simulator:
-    """Simulate game."""
+    """Simulate game.
+    With a seed, games are played by blocks each with their own generator,
+    so that samples can be extended block by block.
+    """
     game: Game
+    seed: Optional[int] = None
 
     @track
     @chrono
-    def play(self, strategy):
+    def play(self, strategy, rng=random):
         """Play one game with given strategy, return score."""
         state = State(1, 0)
         game = self.game
@@ -33,7 +39,7 @@ class Simulator:
                 state.dice += 1
                 state.score -= game.price
             if state.dice:
-                roll = max([randint(1, 6) for _ in range(state.dice)])
+                roll = max([rng.randint(1, 6) for _ in range(state.dice)])
                 state.score += roll
                 if game.rule and state.dice >= 2 \
                         and strategy.sell(step, state, roll):
@@ -43,12 +49,29 @@ class Simulator:
             state.score += game.liquid[state.dice - 1]
         return state.score
 
+    def block(self, strategy, index):
+        """Play block of games of given index with its seeded generator."""
+        rng = random.Random(f"{self.seed}:{index}")
+        return [self.play(strategy, rng) for _ in range(BLOCK)]
+
     @chrono
-    def run(self, size, strategy):
+    def run(self, size, strategy, scores=None):
         """Compute 95% confidence interval on strategy score expectation,
         with given sample size.
+        A list of known scores can be given: it is completed in place
+        by playing only the missing games (whole blocks if seeded).
         """
-        with Pool(CORES) as pool:
-            scores = pool.map(self.play, repeat(strategy(self.game), size))
-        distribution = dict(loc=np.mean(scores), scale=st.sem(scores))
+        scores = [] if scores is None else scores
+        if len(scores) < size:
+            with Pool(CORES) as pool:
+                if self.seed is None:
+                    scores += pool.map(self.play, repeat(
+                        strategy(self.game), size - len(scores)))
+                else:
+                    indices = range(len(scores) // BLOCK, -(-size // BLOCK))
+                    for block in pool.starmap(self.block, zip(
+                            repeat(strategy(self.game)), indices)):
+                        scores += block
+        sample = scores[:size]
+        distribution = dict(loc=np.mean(sample), scale=st.sem(sample))
         return st.t.interval(.95, size - 1, **distribution)
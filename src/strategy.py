@@ -3,6 +3,7 @@ A strategy can either inherit from `Strategy` and implement buy/sell methods,
 or be a standalone function with a buy/sell decorator.
 The strategy's name is changed to lower case in the registry.
 """
+from functools import wraps
 
 
 class Strategy:
@@ -55,6 +56,7 @@ def buy(fun):
     """Register function as buying strategy."""
     strategy = Strategy.access(fun.__name__)
 
+    @wraps(fun)
     def wrapped(self, step, state):
         return fun(self.game, step, state)
     strategy.buy = wrapped
@@ -64,6 +66,7 @@ def sell(fun):
     """Register function as selling strategy."""
     strategy = Strategy.access(fun.__name__)
 
+    @wraps(fun)
     def wrapped(self, step, state, roll):
         return fun(self.game, step, state, roll)
     strategy.sell = wrapped
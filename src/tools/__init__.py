@@ -2,7 +2,9 @@
 * `report` and `table` to present data
 * `chrono` to time function execution
 * `progress` to show progress in a closed loop
+* `Store` to keep results addressed by content hash
 """
+from .cache import Store, digest
 from .progress import Bar, track
 from .report import report, table
 from .timer import Clock, chrono
@@ -0,0 +1,110 @@
+"""Content-addressed result store."""
+
+from hashlib import sha256
+import inspect
+from os import makedirs, replace, unlink
+from os.path import exists, join
+import pickle
+from tempfile import NamedTemporaryFile
+
+CONSTANTS = (int, float, complex, str, bytes, tuple, frozenset)
+
+
+def sources(obj, seen=None):
+    """Collect source code defining `obj` (function or class).
+    Follow decorators, base classes, members and the globals referenced
+    by functions: classes and functions of the same top-level package,
+    and constants (numbers, strings, tuples) by representation.
+    """
+    seen = set() if seen is None else seen
+    obj = inspect.unwrap(obj) if callable(obj) else obj
+    if id(obj) in seen:
+        return []
+    seen.add(id(obj))
+    try:
+        found = [inspect.getsource(obj)]
+    except (OSError, TypeError):  # dynamically created, e.g. by dataclass
+        found = [f"{obj.__module__}.{obj.__qualname__}"]
+    package = obj.__module__.split(".")[0]
+    related = []
+    if inspect.isclass(obj):
+        related += obj.__bases__
+        for member in vars(obj).values():
+            related.append(getattr(member, "__func__", member))
+    elif inspect.isfunction(obj):
+        codes = [obj.__code__]
+        for code in codes:
+            codes += [c for c in code.co_consts if inspect.iscode(c)]
+            for name in code.co_names:
+                value = obj.__globals__.get(name)
+                if isinstance(value, CONSTANTS):
+                    found.append(f"{name} = {value!r}")
+                related.append(value)
+    for item in related:
+        if (inspect.isclass(item) or inspect.isfunction(item)) \
+                and item.__module__.split(".")[0] == package:
+            found += sources(item, seen)
+    return found
+
+
+def digest(*parts):
+    """Hash parts by content: source code for functions and classes,
+    representation for anything else (which should then be deterministic).
+    """
+    sha = sha256()
+    for part in parts:
+        if inspect.isclass(part) or inspect.isfunction(part):
+            content = "\n".join(sources(part))
+        else:
+            content = repr(part)
+        sha.update(content.encode())
+        sha.update(b"\0")
+    return sha.hexdigest()
+
+
+class Store:
+    """Keep computation results on disk, addressed by content hash
+    (see `digest`). A fresh store ignores existing results but saves new ones.
+    """
+
+    def __init__(self, directory, fresh=False):
+        self.directory = directory
+        self.fresh = fresh
+
+    def path(self, key):
+        """File holding result for given key."""
+        return join(self.directory, f"{key}.pickle")
+
+    def get(self, key, default=None):
+        """Get result for given key if known, unless the store is fresh."""
+        if self.fresh:
+            return default
+        return self.load(key, default)
+
+    def load(self, key, default=None):
+        """Load result for given key if known, even if the store is fresh."""
+        if not exists(self.path(key)):
+            return default
+        with open(self.path(key), "rb") as file:
+            return pickle.load(file)
+
+    def put(self, key, value):
+        """Save result for given key, atomically to allow parallel runs."""
+        makedirs(self.directory, exist_ok=True)
+        with NamedTemporaryFile(dir=self.directory, delete=False) as file:
+            try:
+                pickle.dump(value, file)
+            except BaseException:
+                file.close()
+                unlink(file.name)
+                raise
+        replace(file.name, self.path(key))
+        return value
+
+    def memo(self, fun, *parts):
+        """Get result for key built from parts, compute it with `fun` if needed."""
+        key = digest(*parts)
+        value = self.get(key)
+        if value is None:
+            value = self.put(key, fun())
+        return value
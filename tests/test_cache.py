@@ -0,0 +1,91 @@
+"""Check result store keys and seeded simulation extension."""
+
+import importlib
+import pickle
+import subprocess
+import sys
+from os.path import dirname
+
+import pytest
+
+from src import Basic, Game, Simulator, Solver
+from src.simulate import BLOCK
+from src.tools import Store, digest
+
+ROOT = dirname(dirname(__file__))
+
+
+class Unpicklable:
+    def __reduce__(self):
+        raise pickle.PicklingError("unpicklable")
+
+
+def test_digest_stable_across_processes():
+    script = (
+        "from src import Game, Simulator, Solver, Strategy\n"
+        "from src.tools import digest\n"
+        "game = Game(5, 10, limit=3)\n"
+        "print(digest('dynamic', game, Solver))\n"
+        "for name, strategy in Strategy.retrieve().items():\n"
+        "    print(digest('simulation', game, 0, name, Simulator, strategy))\n")
+    outputs = [
+        subprocess.run([sys.executable, "-c", script], cwd=ROOT, check=True,
+                       capture_output=True, text=True).stdout
+        for _ in range(2)]
+    assert outputs[0] == outputs[1]
+
+
+def test_digest_follows_strategy_source(tmp_path, monkeypatch):
+    package = tmp_path / "strategies"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    module = package / "sample.py"
+    template = (
+        "HORIZON = {}\n\n\n"
+        "def helper(step):\n"
+        "    return step < HORIZON\n\n\n"
+        "class Early:\n"
+        "    def buy(self, step, state):\n"
+        "        return helper(step)\n\n\n"
+        "class Late:\n"
+        "    def buy(self, step, state):\n"
+        "        return step > 5\n")
+    module.write_text(template.format(3))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    sample = importlib.import_module("strategies.sample")
+    before = digest(sample.Early), digest(sample.Late)
+    module.write_text(template.format(4))
+    importlib.reload(sample)
+    after = digest(sample.Early), digest(sample.Late)
+    assert before[0] != after[0]
+    assert before[1] == after[1]
+
+
+def test_store(tmp_path):
+    store = Store(str(tmp_path))
+    key = digest("dynamic", Game(5, 10), Solver)
+    assert store.get(key) is None
+    assert store.memo(lambda: 1.5, "dynamic", Game(5, 10), Solver) == 1.5
+    assert store.memo(lambda: 2.5, "dynamic", Game(5, 10), Solver) == 1.5
+    assert Store(str(tmp_path), fresh=True).get(key) is None
+    assert Store(str(tmp_path), fresh=True).load(key) == 1.5
+
+
+def test_store_failed_put(tmp_path):
+    store = Store(str(tmp_path))
+    with pytest.raises(pickle.PicklingError):
+        store.put("key", Unpicklable())
+    assert not list(tmp_path.iterdir())
+
+
+def test_seeded_simulation_extension():
+    simulator = Simulator(Game(5, 10), seed=0)
+    size = BLOCK
+    extended = []
+    simulator.run(size, Basic, extended)
+    first = list(extended)
+    simulator.run(2 * size, Basic, extended)
+    fresh = []
+    simulator.run(2 * size, Basic, fresh)
+    assert extended[:size] == first
+    assert extended == fresh